@@ -0,0 +1,32 @@
+"""Add composite indexes for entity list/query patterns
+
+Revision ID: a7e31c92f0d8
+Revises: d1c4fa6f5bb5
+Create Date: 2026-08-28 09:12:41.553201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e31c92f0d8'
+down_revision: Union[str, None] = 'd1c4fa6f5bb5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_entities_parent_notdeleted', 'entities', ['parent_id', 'is_deleted'], unique=False)
+    op.create_index('ix_entities_label', 'entities', ['label'], unique=False)
+    op.create_index('ix_entities_is_collection_parent', 'entities', ['is_collection', 'parent_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_entities_is_collection_parent', table_name='entities')
+    op.drop_index('ix_entities_label', table_name='entities')
+    op.drop_index('ix_entities_parent_notdeleted', table_name='entities')
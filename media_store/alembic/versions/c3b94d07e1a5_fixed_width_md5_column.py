@@ -0,0 +1,34 @@
+"""Use a fixed-width String(32) for the md5 columns
+
+Revision ID: c3b94d07e1a5
+Revises: a7e31c92f0d8
+Create Date: 2026-08-28 10:05:17.884312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3b94d07e1a5'
+down_revision: Union[str, None] = 'a7e31c92f0d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('entities') as batch_op:
+        batch_op.alter_column('md5', type_=sa.String(length=32), existing_nullable=True)
+    with op.batch_alter_table('entities_version') as batch_op:
+        batch_op.alter_column('md5', type_=sa.String(length=32), existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('entities_version') as batch_op:
+        batch_op.alter_column('md5', type_=sa.String(), existing_nullable=True)
+    with op.batch_alter_table('entities') as batch_op:
+        batch_op.alter_column('md5', type_=sa.String(), existing_nullable=True)
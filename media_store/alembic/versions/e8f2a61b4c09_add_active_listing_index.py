@@ -0,0 +1,28 @@
+"""Add (is_deleted, id) covering index for active listings
+
+Revision ID: e8f2a61b4c09
+Revises: c3b94d07e1a5
+Create Date: 2026-08-28 11:21:08.440915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8f2a61b4c09'
+down_revision: Union[str, None] = 'c3b94d07e1a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_entity_active', 'entities', ['is_deleted', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_entity_active', table_name='entities')
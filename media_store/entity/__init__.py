@@ -1,6 +1,8 @@
 """CoLAN Media Store Server."""
-from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import configure_mappers
 
 # CRITICAL: Import versioning BEFORE models
@@ -10,19 +12,44 @@ from .routes import router
 # Configure mappers after all models are imported (required for versioning)
 configure_mappers()
 
-app = FastAPI(title="CoLAN server", version="v1")
-
-app.include_router(router)
-
 
-@app.exception_handler(HTTPException)
-async def validation_exception_handler(request: Request, exc: HTTPException):
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """
-    Preserve the default FastAPI HTTPException handling shape so callers
-    can rely on the same error response structure.
+    One-time startup warm-up so the first request doesn't pay cold-path
+    costs. Opens a pooled connection (creating the SQLite file and
+    applying the per-connection pragmas) and primes SQLAlchemy's
+    dialect/statement caches with the hot lookup shape.
     """
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail},
-    )
+    from sqlalchemy import text
+
+    from .database import engine, get_db, SessionLocal
+    from .models import Entity
+
+    # When tests override get_db they supply their own engine; warming the
+    # real one would create the runtime database as a side effect
+    if get_db in app.dependency_overrides:
+        yield
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    try:
+        with SessionLocal() as session:
+            session.get(Entity, 0)
+    except Exception:
+        # Schema may not exist yet (fresh deployment before migrations);
+        # warm-up is best-effort only
+        pass
+    yield
+
+
+app = FastAPI(
+    title="CoLAN server",
+    version="v1",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.include_router(router)
 
@@ -12,9 +12,11 @@ DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_DIR}/media_store.
 # Can be overridden with MEDIA_STORAGE_DIR environment variable
 MEDIA_STORAGE_DIR = os.getenv("MEDIA_STORAGE_DIR", f"{DATABASE_DIR}/media_store")
 
-# Ensure directories exist
-Path(DATABASE_DIR).mkdir(parents=True, exist_ok=True)
-Path(MEDIA_STORAGE_DIR).mkdir(parents=True, exist_ok=True)
+# Ensure directories exist (is_dir fast path skips the mkdir syscalls on
+# the common case where the directories are already in place)
+for _dir in (Path(DATABASE_DIR), Path(MEDIA_STORAGE_DIR)):
+    if not _dir.is_dir():
+        _dir.mkdir(parents=True, exist_ok=True)
 
 __all__ = ["DATABASE_DIR", "DATABASE_URL", "MEDIA_STORAGE_DIR"]
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 # CRITICAL: Import versioning BEFORE models to ensure make_versioned() is called first
@@ -12,13 +12,38 @@ from . import versioning  # noqa: F401
 from .config import DATABASE_URL
 from .models import Base
 
+# Pool sizing only applies to file-backed databases (QueuePool); in-memory
+# SQLite uses SingletonThreadPool, which rejects these arguments
+_pool_kwargs = {} if ":memory:" in DATABASE_URL else {"pool_size": 10, "max_overflow": 20}
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Needed for SQLite
     echo=False,  # Set to True for SQL query logging
+    pool_pre_ping=True,
+    query_cache_size=1200,  # Room for all hot statement shapes incl. versioning
+    **_pool_kwargs,
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune SQLite for concurrent FastAPI workers on every new connection.
+
+    WAL lets readers proceed while a writer commits, synchronous=NORMAL is
+    safe with WAL, and the cache/mmap settings keep hot pages in memory.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -37,14 +37,9 @@ class FileStorageService:
         Returns:
             Path object for the file storage location
         """
-        # Use current date for organization
-        now = datetime.utcnow()
-        year = now.strftime("%Y")
-        month = now.strftime("%m")
-        day = now.strftime("%d")
-        
-        # Create directory structure
-        dir_path = self.base_dir / year / month / day
+        # Use current date for organization; one strftime call formats the
+        # whole YYYY/MM/DD prefix (datetime.utcnow is deprecated)
+        dir_path = self.base_dir / datetime.now(timezone.utc).strftime("%Y/%m/%d")
         dir_path.mkdir(parents=True, exist_ok=True)
         
         # Generate filename with MD5 and extension
@@ -85,6 +80,35 @@ class FileStorageService:
         # Return relative path from base_dir
         return str(file_path.relative_to(self.base_dir))
     
+    def save_file_from_path(
+        self,
+        src_path: Path,
+        metadata: dict,
+        original_filename: str = "file"
+    ) -> str:
+        """
+        Move an already-written file (e.g. a streamed upload) into storage.
+
+        Unlike save_file, this avoids re-writing the payload: the source
+        file is renamed/moved into the organized directory structure.
+
+        Args:
+            src_path: Path to the file to take ownership of
+            metadata: File metadata dictionary
+            original_filename: Original filename
+
+        Returns:
+            Relative path to the saved file
+        """
+        # Get storage path
+        file_path = self.get_storage_path(metadata, original_filename)
+
+        # Move file into place (rename when on the same filesystem)
+        shutil.move(str(src_path), str(file_path))
+
+        # Return relative path from base_dir
+        return str(file_path.relative_to(self.base_dir))
+
     def delete_file(self, relative_path: str) -> bool:
         """
         Delete file from storage.
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, Boolean, Float, Integer, String
+from sqlalchemy import BigInteger, Boolean, Float, Index, Integer, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -17,7 +17,16 @@ class Entity(Base):
     
     __tablename__ = "entities"
     __versioned__ = {}  # Enable SQLAlchemy-Continuum versioning
-    
+    __table_args__ = (
+        # Composite indexes matching the common list/query patterns so they
+        # use B-tree lookups instead of full table scans as the table grows
+        Index("ix_entities_parent_notdeleted", "parent_id", "is_deleted"),
+        Index("ix_entities_label", "label"),
+        Index("ix_entities_is_collection_parent", "is_collection", "parent_id"),
+        # Covers WHERE is_deleted=? ORDER BY id listings from the index alone
+        Index("ix_entity_active", "is_deleted", "id"),
+    )
+
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     
@@ -40,7 +49,9 @@ class Entity(Base):
     mime_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     extension: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    md5: Mapped[Optional[str]] = mapped_column(String, unique=True, index=True, nullable=True)
+    # Fixed-width hex digest: a bounded column keeps the unique index compact
+    # and comparisons cheap (hex form is required by the API and file layout)
+    md5: Mapped[Optional[str]] = mapped_column(String(32), unique=True, index=True, nullable=True)
     
     # File storage
     file_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import hashlib
+import tempfile
+from pathlib import Path as FilePath
+from typing import List, Optional, Tuple
 
 from fastapi import (
     APIRouter,
@@ -14,7 +17,7 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from .schemas import (
@@ -26,12 +29,54 @@ from .schemas import (
     PaginationMetadata,
 )
 
+from fastapi.concurrency import run_in_threadpool
+
 from .database import get_db
 from .service import DuplicateFileError, EntityService
 
 router = APIRouter()
 
 
+def get_entity_service(db: Session = Depends(get_db)) -> EntityService:
+    """Per-request EntityService dependency (resolved once per request)."""
+    return EntityService(db)
+
+
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Shared miss-path exception: FastAPI's handler only reads it, so one
+# instance can be raised from every 404 site without per-miss allocation
+ENTITY_NOT_FOUND = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND, detail="Entity not found"
+)
+
+
+async def _stream_upload_to_temp(image: UploadFile, filename: str) -> Tuple[FilePath, str]:
+    """
+    Stream an uploaded file to a named temporary file in fixed-size chunks
+    so large uploads never sit fully in memory. The MD5 digest is updated
+    chunk-by-chunk during the write, so hashing costs no extra pass over
+    the payload.
+
+    The caller owns the returned file and must remove it (the storage
+    layer moves it into place on success).
+
+    Returns:
+        Tuple of (temp file path, MD5 hex digest)
+    """
+    digest = hashlib.md5()
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=FilePath(filename).suffix)
+    try:
+        with tmp:
+            while chunk := await image.read(_UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                tmp.write(chunk)
+    except Exception:
+        FilePath(tmp.name).unlink(missing_ok=True)
+        raise
+    return FilePath(tmp.name), digest.hexdigest()
+
+
 @router.get(
     "/entity/",
     tags=["entity"],
@@ -40,7 +85,7 @@ router = APIRouter()
     operation_id="get_entities_entity__get",
     responses={200: {"model": PaginatedResponse, "description": "Successful Response"}},
 )
-async def get_entities(
+def get_entities(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
     version: Optional[int] = Query(
@@ -52,9 +97,8 @@ async def get_entities(
     search_query: Optional[str] = Query(
         None, title="Search Query", description="Optional search query"
     ),
-    db: Session = Depends(get_db),
-) -> PaginatedResponse:
-    service = EntityService(db)
+    service: EntityService = Depends(get_entity_service),
+) -> ORJSONResponse:
     items, total_count = service.get_entities(
         page=page,
         page_size=page_size,
@@ -78,7 +122,9 @@ async def get_entities(
         has_prev=has_prev,
     )
     
-    return PaginatedResponse(items=items, pagination=pagination)
+    # Serialize once with orjson and skip FastAPI's response re-validation
+    response = PaginatedResponse(items=items, pagination=pagination)
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
 @router.post(
@@ -96,10 +142,8 @@ async def create_entity(
     description: Optional[str] = Form(None, title="Description"),
     parent_id: Optional[int] = Form(None, title="Parent Id"),
     image: Optional[UploadFile] = File(None, title="Image"),
-    db: Session = Depends(get_db),
+    service: EntityService = Depends(get_entity_service),
 ) -> Item:
-    service = EntityService(db)
-    
     # Create body object from form fields
     body = BodyCreateEntity(
         is_collection=is_collection,
@@ -108,19 +152,26 @@ async def create_entity(
         parent_id=parent_id
     )
     
-    # Read file bytes and filename if provided
-    file_bytes = None
+    # Stream the upload to a temp file instead of buffering it in memory
+    upload_path = None
+    upload_md5 = None
     filename = "file"
     if image:
-        file_bytes = await image.read()
         filename = image.filename or "file"
-    
+        upload_path, upload_md5 = await _stream_upload_to_temp(image, filename)
+
     try:
-        return service.create_entity(body, file_bytes, filename)
+        return await run_in_threadpool(
+            service.create_entity, body, upload_path, filename, upload_md5=upload_md5
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except DuplicateFileError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    finally:
+        # No-op on success: the storage layer has already moved the file
+        if upload_path:
+            upload_path.unlink(missing_ok=True)
 
 
 @router.delete(
@@ -131,10 +182,11 @@ async def create_entity(
     operation_id="delete_collection_entity__delete",
     responses={200: {"model": None, "description": "Successful Response"}},
 )
-async def delete_collection(db: Session = Depends(get_db)) -> JSONResponse:
-    service = EntityService(db)
+def delete_collection(
+    service: EntityService = Depends(get_entity_service),
+) -> ORJSONResponse:
     service.delete_all_entities()
-    return JSONResponse(content=None, status_code=status.HTTP_200_OK)
+    return ORJSONResponse(content=None, status_code=status.HTTP_200_OK)
 
 
 @router.get(
@@ -145,7 +197,7 @@ async def delete_collection(db: Session = Depends(get_db)) -> JSONResponse:
     operation_id="get_entity_entity__entity_id__get",
     responses={200: {"model": Item, "description": "Successful Response"}},
 )
-async def get_entity(
+def get_entity(
     entity_id: int = Path(..., title="Entity Id"),
     version: Optional[int] = Query(
         None, title="Version", description="Optional version number to retrieve"
@@ -153,9 +205,8 @@ async def get_entity(
     content: Optional[str] = Query(
         None, title="Content", description="Optional content query"
     ),
-    db: Session = Depends(get_db),
+    service: EntityService = Depends(get_entity_service),
 ) -> Item:
-    service = EntityService(db)
     item = service.get_entity_by_id(entity_id, version=version)
     if not item:
         if version is not None:
@@ -163,7 +214,7 @@ async def get_entity(
                 status_code=404, 
                 detail=f"Entity {entity_id} version {version} not found"
             )
-        raise HTTPException(status_code=404, detail="Entity not found")
+        raise ENTITY_NOT_FOUND
     return item
 
 
@@ -182,10 +233,8 @@ async def put_entity(
     description: Optional[str] = Form(None, title="Description"),
     parent_id: Optional[int] = Form(None, title="Parent Id"),
     image: Optional[UploadFile] = File(None, title="Image"),
-    db: Session = Depends(get_db),
+    service: EntityService = Depends(get_entity_service),
 ) -> Item:
-    service = EntityService(db)
-    
     # Create body object from form fields
     body = BodyUpdateEntity(
         is_collection=is_collection,
@@ -194,22 +243,29 @@ async def put_entity(
         parent_id=parent_id
     )
     
-    # Read file bytes and filename if provided
-    file_bytes = None
+    # Stream the upload to a temp file instead of buffering it in memory
+    upload_path = None
+    upload_md5 = None
     filename = "file"
     if image:
-        file_bytes = await image.read()
         filename = image.filename or "file"
-    
+        upload_path, upload_md5 = await _stream_upload_to_temp(image, filename)
+
     try:
-        item = service.update_entity(entity_id, body, file_bytes, filename)
+        item = await run_in_threadpool(
+            service.update_entity, entity_id, body, upload_path, filename, upload_md5=upload_md5
+        )
         if not item:
-            raise HTTPException(status_code=404, detail="Entity not found")
+            raise ENTITY_NOT_FOUND
         return item
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except DuplicateFileError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    finally:
+        # No-op on success: the storage layer has already moved the file
+        if upload_path:
+            upload_path.unlink(missing_ok=True)
 
 
 @router.patch(
@@ -223,15 +279,14 @@ async def put_entity(
         404: {"description": "Entity not found"},
     },
 )
-async def patch_entity(
+def patch_entity(
     entity_id: int, 
-    body: BodyPatchEntity = Body(..., embed=True), 
-    db: Session = Depends(get_db)
+    body: BodyPatchEntity = Body(..., embed=True),
+    service: EntityService = Depends(get_entity_service),
 ) -> Item:
-    service = EntityService(db)
     item = service.patch_entity(entity_id, body)
     if not item:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entity not found")
+        raise ENTITY_NOT_FOUND
     return item
 
 
@@ -246,11 +301,13 @@ async def patch_entity(
         404: {"description": "Entity not found"},
     },
 )
-async def delete_entity(entity_id: int, db: Session = Depends(get_db)) -> Item:
-    service = EntityService(db)
+def delete_entity(
+    entity_id: int,
+    service: EntityService = Depends(get_entity_service),
+) -> Item:
     item = service.delete_entity(entity_id)
     if not item:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entity not found")
+        raise ENTITY_NOT_FOUND
     return item
 
 
@@ -262,11 +319,10 @@ async def delete_entity(entity_id: int, db: Session = Depends(get_db)) -> Item:
     operation_id="get_entity_versions_entity__entity_id__versions_get",
     responses={200: {"model": List[dict], "description": "Successful Response"}},
 )
-async def get_entity_versions(
+def get_entity_versions(
     entity_id: int = Path(..., title="Entity Id"),
-    db: Session = Depends(get_db),
+    service: EntityService = Depends(get_entity_service),
 ) -> List[dict]:
-    service = EntityService(db)
     versions = service.get_entity_versions(entity_id)
     if not versions:
         raise HTTPException(status_code=404, detail="Entity not found or no versions available")
@@ -282,5 +338,5 @@ async def get_entity_versions(
     operation_id="root_get",
     responses={200: {"description": "Welcome to CoLAN"}},
 )
-async def root() -> JSONResponse:
-    return JSONResponse(content={"message": "Welcome to CoLAN!"})
+async def root() -> ORJSONResponse:
+    return ORJSONResponse(content={"message": "Welcome to CoLAN!"})
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BodyCreateEntity(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     label: Optional[str] = Field(None, title="Label")
     description: Optional[str] = Field(None, title="Description")
     parent_id: Optional[int] = Field(None, title="Parent Id")
@@ -14,6 +16,8 @@ class BodyCreateEntity(BaseModel):
 
 
 class BodyUpdateEntity(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     label: Optional[str] = Field(None, title="Label")
     description: Optional[str] = Field(None, title="Description")
     parent_id: Optional[int] = Field(None, title="Parent Id")
@@ -22,6 +26,8 @@ class BodyUpdateEntity(BaseModel):
 
 
 class BodyPatchEntity(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     label: Optional[str] = Field(None, title="Label")
     description: Optional[str] = Field(None, title="Description")
     parent_id: Optional[int] = Field(None, title="Parent Id")
@@ -29,6 +35,8 @@ class BodyPatchEntity(BaseModel):
 
 
 class Item(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     id: Optional[int] = Field(None, title="Id", read_only=True)
     is_collection: Optional[bool] = Field(None, title="Is Collection")
     label: Optional[str] = Field(None, title="Label")
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import tempfile
-from datetime import datetime
+import hashlib
+import operator
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from clmediakit import CLMetaData
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import lambda_stmt
 
 from .schemas import BodyCreateEntity, BodyPatchEntity, BodyUpdateEntity, Item
 from .models import Entity
@@ -19,6 +23,23 @@ class DuplicateFileError(Exception):
     pass
 
 
+# Entity columns fetched for list responses, in Item field order. Pulling
+# plain column tuples instead of full ORM objects skips identity-map
+# hydration for rows that are immediately converted to Items.
+_ITEM_COLUMNS = tuple(getattr(Entity, name) for name in Item.model_fields)
+
+# Item field names and a C-level bulk attribute reader for converting loaded
+# ORM instances; attrgetter fetches all fields in one call instead of 18
+# separate descriptor dispatches
+_ITEM_FIELDS = tuple(Item.model_fields)
+_ITEM_GETTER = operator.attrgetter(*_ITEM_FIELDS)
+
+# Content-addressed cache of extracted metadata. Re-uploads of the same
+# bytes (client retries, PUT re-sends) skip the CLMetaData run entirely.
+_METADATA_CACHE: "OrderedDict[str, Dict]" = OrderedDict()
+_METADATA_CACHE_SIZE = 512
+
+
 class EntityService:
     """Service layer for entity operations."""
     
@@ -36,44 +57,76 @@ class EntityService:
     @staticmethod
     def _now_timestamp() -> int:
         """Return current UTC timestamp in milliseconds."""
-        return int(datetime.utcnow().timestamp() * 1000)
+        return int(datetime.now(timezone.utc).timestamp() * 1000)
     
-    def _extract_metadata(self, file_bytes: bytes, filename: str = "file") -> Dict:
+    def _extract_metadata(self, file_path: Path) -> Dict:
         """
-        Extract metadata from file using CLMetaData.
-        
+        Extract metadata from a file on disk using CLMetaData.
+
         Args:
-            file_bytes: File content as bytes
-            filename: Original filename for extension detection
-            
+            file_path: Path to the file to inspect
+
         Returns:
             Dictionary containing file metadata
         """
-        # Create temporary file for CLMetaData processing
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(filename).suffix) as tmp_file:
-            tmp_file.write(file_bytes)
-            tmp_path = tmp_file.name
-        
-        try:
-            # Extract metadata using CLMetaData
-            cl_metadata = CLMetaData.from_media(tmp_path)
-            metadata = cl_metadata.to_dict()
-            
-            # Convert CreateDate to timestamp (ms) if present
-            if "CreateDate" in metadata and metadata["CreateDate"]:
-                try:
-                    # Attempt to parse EXIF date format: YYYY:MM:DD HH:MM:SS
-                    dt = datetime.strptime(str(metadata["CreateDate"]), "%Y:%m:%d %H:%M:%S")
-                    metadata["CreateDate"] = int(dt.timestamp() * 1000)
-                except ValueError:
-                    # Fallback or ignore if format is different
-                    pass
-                    
-            return metadata
-        finally:
-            # Clean up temporary file
-            Path(tmp_path).unlink(missing_ok=True)
-    
+        # Extract metadata using CLMetaData
+        cl_metadata = CLMetaData.from_media(str(file_path))
+        metadata = cl_metadata.to_dict()
+
+        # Convert CreateDate to timestamp (ms) if present
+        if "CreateDate" in metadata and metadata["CreateDate"]:
+            try:
+                # Attempt to parse EXIF date format: YYYY:MM:DD HH:MM:SS
+                dt = datetime.strptime(str(metadata["CreateDate"]), "%Y:%m:%d %H:%M:%S")
+                metadata["CreateDate"] = int(dt.timestamp() * 1000)
+            except ValueError:
+                # Fallback or ignore if format is different
+                pass
+
+        return metadata
+
+    @staticmethod
+    def _compute_md5(file_path: Path) -> str:
+        """
+        Compute the MD5 hex digest of a file.
+
+        Uses hashlib.file_digest on Python 3.11+, which hashes in C
+        (releasing the GIL for large files); falls back to chunked
+        updates on older interpreters.
+        """
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "md5").hexdigest()
+            digest = hashlib.md5()
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+    def _cached_metadata(self, file_path: Path, md5: str) -> Dict:
+        """
+        Extract metadata, memoized on the content hash.
+
+        Args:
+            file_path: Path to the file to inspect
+            md5: MD5 hex digest of the file content
+
+        Returns:
+            Dictionary containing file metadata (md5 always populated)
+        """
+        cached = _METADATA_CACHE.get(md5)
+        if cached is not None:
+            _METADATA_CACHE.move_to_end(md5)
+            return dict(cached)
+
+        metadata = self._extract_metadata(file_path)
+        metadata["md5"] = md5
+
+        _METADATA_CACHE[md5] = dict(metadata)
+        if len(_METADATA_CACHE) > _METADATA_CACHE_SIZE:
+            _METADATA_CACHE.popitem(last=False)
+
+        return metadata
+
     def _check_duplicate_md5(self, md5: str, exclude_entity_id: Optional[int] = None) -> Optional[Entity]:
         """
         Check if an entity with the given MD5 already exists.
@@ -85,12 +138,16 @@ class EntityService:
         Returns:
             Entity if duplicate found, None otherwise
         """
-        query = self.db.query(Entity).filter(Entity.md5 == md5)
-        
+        # lambda_stmt caches the compiled statement; md5/exclude_entity_id
+        # are tracked as bind parameters across calls
+        stmt = lambda_stmt(lambda: select(Entity).where(Entity.md5 == md5))
+
         if exclude_entity_id is not None:
-            query = query.filter(Entity.id != exclude_entity_id)
-        
-        return query.first()
+            stmt += lambda s: s.where(Entity.id != exclude_entity_id)
+
+        stmt += lambda s: s.limit(1)
+
+        return self.db.execute(stmt).scalars().first()
     
     @staticmethod
     def _entity_to_item(entity: Entity) -> Item:
@@ -103,25 +160,10 @@ class EntityService:
         Returns:
             Pydantic Item instance
         """
-        return Item(
-            id=entity.id,
-            is_collection=entity.is_collection,
-            label=entity.label,
-            description=entity.description,
-            parent_id=entity.parent_id,
-            added_date=entity.added_date,
-            updated_date=entity.updated_date,
-            create_date=entity.create_date,
-            file_size=entity.file_size,
-            height=entity.height,
-            width=entity.width,
-            duration=entity.duration,
-            mime_type=entity.mime_type,
-            type=entity.type,
-            extension=entity.extension,
-            md5=entity.md5,
-            file_path=entity.file_path,
-            is_deleted=entity.is_deleted,
+        # Values come straight from the DB row, so model_construct can skip
+        # validation; attrgetter reads every field in a single C call
+        return Item.model_construct(
+            **dict(zip(_ITEM_FIELDS, _ITEM_GETTER(entity)))
         )
     
     def get_entities(
@@ -145,30 +187,41 @@ class EntityService:
         Returns:
             Tuple of (items, total_count)
         """
-        query = self.db.query(Entity)
-        
         # TODO: Implement filtering and search logic
         # For now, return all entities
-        
-        # Get total count before pagination
-        total_count = query.count()
-        
+
+        # Get total count before pagination (precompiled via lambda cache)
+        total_count = self.db.execute(
+            lambda_stmt(lambda: select(func.count()).select_from(Entity))
+        ).scalar_one()
+
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-        
-        entities = query.all()
-        
+
         # If version is specified, get that version of each entity
         if version is not None:
+            entity_ids = [
+                row.id
+                for row in self.db.query(Entity.id).order_by(Entity.id).offset(offset).limit(page_size)
+            ]
             items = []
-            for entity in entities:
-                versioned_item = self.get_entity_version(entity.id, version)
+            for entity_id in entity_ids:
+                versioned_item = self.get_entity_version(entity_id, version)
                 if versioned_item:  # Only include if version exists
                     items.append(versioned_item)
         else:
-            items = [self._entity_to_item(entity) for entity in entities]
-        
+            # Fetch plain column rows and bypass per-field validation:
+            # the values come straight from our own schema
+            rows = self.db.execute(
+                lambda_stmt(
+                    lambda: select(*_ITEM_COLUMNS)
+                    .order_by(Entity.id)
+                    .offset(offset)
+                    .limit(page_size)
+                )
+            ).all()
+            items = [Item.model_construct(**row._mapping) for row in rows]
+
         return items, total_count
     
     def get_entity_by_id(self, entity_id: int, version: Optional[int] = None) -> Optional[Item]:
@@ -185,7 +238,7 @@ class EntityService:
         if version is not None:
             return self.get_entity_version(entity_id, version)
         
-        entity = self.db.query(Entity).filter(Entity.id == entity_id).first()
+        entity = self.db.get(Entity, entity_id)
         if entity:
             return self._entity_to_item(entity)
         return None
@@ -202,7 +255,7 @@ class EntityService:
             Item instance for the specified version or None if not found
         """
         # First check if the entity exists
-        entity = self.db.query(Entity).filter(Entity.id == entity_id).first()
+        entity = self.db.get(Entity, entity_id)
         if not entity:
             return None
         
@@ -227,7 +280,7 @@ class EntityService:
         Returns:
             List of version metadata dictionaries
         """
-        entity = self.db.query(Entity).filter(Entity.id == entity_id).first()
+        entity = self.db.get(Entity, entity_id)
         if not entity:
             return []
         
@@ -247,22 +300,24 @@ class EntityService:
         return result
     
     def create_entity(
-        self, 
-        body: BodyCreateEntity, 
-        image: Optional[bytes] = None,
-        filename: str = "file"
+        self,
+        body: BodyCreateEntity,
+        upload_path: Optional[Path] = None,
+        filename: str = "file",
+        upload_md5: Optional[str] = None
     ) -> Item:
         """
         Create a new entity.
-        
+
         Args:
             body: Entity creation data
-            image: Optional image file bytes
+            upload_path: Optional path to the streamed upload on disk
             filename: Original filename
-            
+            upload_md5: Optional MD5 computed while streaming the upload
+
         Returns:
             Created Item instance
-            
+
         Raises:
             DuplicateFileError: If file with same MD5 already exists
         """
@@ -271,28 +326,31 @@ class EntityService:
         file_path = None
 
         # Validation: image is required if is_collection is False
-        if not body.is_collection and not image:
+        if not body.is_collection and not upload_path:
             raise ValueError("Image is required when is_collection is False")
-        
+
         # Validation: image should not be present if is_collection is True
-        if body.is_collection and image:
+        if body.is_collection and upload_path:
             raise ValueError("Image should not be provided when is_collection is True")
-        
+
         # Extract metadata and save file if provided
-        if image:
-            # Extract metadata using CLMetaData
-            file_meta = self._extract_metadata(image, filename)
-            
-            # Check for duplicate MD5
-            if file_meta.get("md5"):
-                duplicate = self._check_duplicate_md5(file_meta["md5"])
-                if duplicate:
-                    raise DuplicateFileError(
-                        f"File with MD5 {file_meta['md5']} already exists (entity ID: {duplicate.id})"
-                    )
-            
-            # Save file to storage
-            file_path = self.file_storage.save_file(image, file_meta, filename)
+        if upload_path:
+            # The content hash is cheap (streamed or one hashlib pass), so
+            # run the duplicate check before paying for metadata extraction
+            if not upload_md5:
+                upload_md5 = self._compute_md5(upload_path)
+
+            duplicate = self._check_duplicate_md5(upload_md5)
+            if duplicate:
+                raise DuplicateFileError(
+                    f"File with MD5 {upload_md5} already exists (entity ID: {duplicate.id})"
+                )
+
+            # Extract metadata (memoized on the content hash)
+            file_meta = self._cached_metadata(upload_path, upload_md5)
+
+            # Move file into storage without re-writing the payload
+            file_path = self.file_storage.save_file_from_path(upload_path, file_meta, filename)
         
         entity = Entity(
             is_collection=body.is_collection,
@@ -316,40 +374,53 @@ class EntityService:
         
         try:
             self.db.add(entity)
+            # Flush assigns the primary key; build the Item from in-memory
+            # state so no post-commit SELECT (refresh) is needed
+            self.db.flush()
+            item = self._entity_to_item(entity)
             self.db.commit()
-            self.db.refresh(entity)
-        except IntegrityError as e:
+        except IntegrityError:
             self.db.rollback()
-            # Clean up file if database insert failed
-            if file_path:
+            # A concurrent insert won the unique-md5 race between our
+            # pre-check and commit; report it exactly like the pre-check
+            duplicate = self._check_duplicate_md5(upload_md5) if upload_md5 else None
+            # Clean up the stored file unless the winner owns the same
+            # content-addressed path
+            if file_path and not (duplicate and duplicate.file_path == file_path):
                 self.file_storage.delete_file(file_path)
+            if duplicate:
+                raise DuplicateFileError(
+                    f"File with MD5 {upload_md5} already exists (entity ID: {duplicate.id})"
+                )
             raise DuplicateFileError(f"Duplicate MD5 detected: {file_meta.get('md5')}")
-        
-        return self._entity_to_item(entity)
-    
+
+        return item
+
     def update_entity(
-        self, 
-        entity_id: int, 
+        self,
+        entity_id: int,
         body: BodyUpdateEntity,
-        image: bytes,
-        filename: str = "file"
+        upload_path: Optional[Path],
+        filename: str = "file",
+        upload_md5: Optional[str] = None
     ) -> Optional[Item]:
         """
         Fully update an existing entity (PUT) - requires file upload.
-        
+
         Args:
             entity_id: Entity ID
             body: Entity update data
-            image: Image file bytes (mandatory for PUT)
+            upload_path: Optional path to the streamed upload on disk
             filename: Original filename
-            
+            upload_md5: Optional MD5 computed while streaming the upload
+
         Returns:
             Updated Item instance or None if not found
-            
+
         Raises:
             DuplicateFileError: If file with same MD5 already exists
         """
-        entity = self.db.query(Entity).filter(Entity.id == entity_id).first()
+        entity = self.db.get(Entity, entity_id)
         if not entity:
             return None
 
@@ -360,33 +431,37 @@ class EntityService:
                 f"Cannot change is_collection from {entity.is_collection} to {body.is_collection}. "
                 "is_collection is immutable after entity creation."
             )
-        
+
         # Validation: image should not be present if is_collection is True
-        if entity.is_collection and image:
+        if entity.is_collection and upload_path:
             raise ValueError("Image should not be provided when is_collection is True")
-        
+
         # Note: image is optional if is_collection is False (for PUT operations)
         # This allows updating metadata without changing the file
-        
-        if image:
-            # Extract metadata from new file
-            file_meta = self._extract_metadata(image, filename)
-            
+
+        if upload_path:
+            # The content hash is cheap (streamed or one hashlib pass), so
+            # run the duplicate check before paying for metadata extraction
+            if not upload_md5:
+                upload_md5 = self._compute_md5(upload_path)
+
             # Check for duplicate MD5 (excluding current entity)
-            if file_meta.get("md5"):
-                duplicate = self._check_duplicate_md5(file_meta["md5"], exclude_entity_id=entity_id)
-                if duplicate:
-                    raise DuplicateFileError(
-                        f"File with MD5 {file_meta['md5']} already exists (entity ID: {duplicate.id})"
-                    )
+            duplicate = self._check_duplicate_md5(upload_md5, exclude_entity_id=entity_id)
+            if duplicate:
+                raise DuplicateFileError(
+                    f"File with MD5 {upload_md5} already exists (entity ID: {duplicate.id})"
+                )
+
+            # Extract metadata from the new file (memoized on content hash)
+            file_meta = self._cached_metadata(upload_path, upload_md5)
             
             # Delete old file if exists
             old_file_path = entity.file_path
             if old_file_path:
                 self.file_storage.delete_file(old_file_path)
             
-            # Save new file
-            file_path = self.file_storage.save_file(image, file_meta, filename)
+            # Move new file into storage without re-writing the payload
+            file_path = self.file_storage.save_file_from_path(upload_path, file_meta, filename)
                    
             # Update file metadata
             entity.file_size = file_meta.get("FileSize")
@@ -409,17 +484,30 @@ class EntityService:
 
         
         try:
+            # All mutated fields are Python-side; flush, snapshot, commit —
+            # no refresh round-trip required
+            self.db.flush()
+            item = self._entity_to_item(entity)
             self.db.commit()
-            self.db.refresh(entity)
         except IntegrityError:
             self.db.rollback()
-            # Clean up new file if database update failed
-            if file_path:
+            # A concurrent write won the unique-md5 race between our
+            # pre-check and commit; report it exactly like the pre-check
+            duplicate = (
+                self._check_duplicate_md5(upload_md5, exclude_entity_id=entity_id)
+                if upload_md5
+                else None
+            )
+            if upload_path and file_path and not (duplicate and duplicate.file_path == file_path):
                 self.file_storage.delete_file(file_path)
-            raise DuplicateFileError(f"Duplicate MD5 detected: {file_meta.get('md5')}")
-        
-        return self._entity_to_item(entity)
-    
+            if duplicate:
+                raise DuplicateFileError(
+                    f"File with MD5 {upload_md5} already exists (entity ID: {duplicate.id})"
+                )
+            raise DuplicateFileError(f"Duplicate MD5 detected: {upload_md5}")
+
+        return item
+
     def patch_entity(self, entity_id: int, body: BodyPatchEntity) -> Optional[Item]:
         """
         Partially update an existing entity (PATCH).
@@ -431,20 +519,23 @@ class EntityService:
         Returns:
             Updated Item instance or None if not found
         """
-        entity = self.db.query(Entity).filter(Entity.id == entity_id).first()
+        entity = self.db.get(Entity, entity_id)
         if not entity:
             return None
         
-        # Update only provided fields
-        for field, value in body.dict(exclude_unset=True).items():
-            setattr(entity, field, value)
+        # Update only the fields actually present in the request; iterating
+        # the fields-set avoids building an intermediate dict (and the
+        # deprecated v1-style .dict() call)
+        for field in body.__pydantic_fields_set__:
+            setattr(entity, field, getattr(body, field))
         
         entity.updated_date = self._now_timestamp()
-        
+
+        self.db.flush()
+        item = self._entity_to_item(entity)
         self.db.commit()
-        self.db.refresh(entity)
-        
-        return self._entity_to_item(entity)
+
+        return item
     
     def delete_entity(self, entity_id: int) -> Optional[Item]:
         """
@@ -456,20 +547,27 @@ class EntityService:
         Returns:
             Deleted Item instance or None if not found
         """
-        entity = self.db.query(Entity).filter(Entity.id == entity_id).first()
+        entity = self.db.get(Entity, entity_id)
         if not entity:
             return None
         
+        # Snapshot before the delete so no attribute access happens on a
+        # deleted, expired instance after commit
+        item = self._entity_to_item(entity)
+
         # Hard delete: remove file and database record
         if entity.file_path:
             self.file_storage.delete_file(entity.file_path)
-            
+
         self.db.delete(entity)
         self.db.commit()
-        
-        return self._entity_to_item(entity)
+
+        return item
     
     def delete_all_entities(self) -> None:
         """Delete all entities from the database."""
-        self.db.query(Entity).delete()
+        # Single DELETE statement; skip identity-map synchronization and
+        # expire whatever is already loaded instead of hydrating every row
+        self.db.query(Entity).delete(synchronize_session=False)
         self.db.commit()
+        self.db.expire_all()
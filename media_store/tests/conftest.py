@@ -18,7 +18,6 @@ from sqlalchemy.pool import StaticPool
 
 from test_config import (
     IMAGES_DIR,
-    TEST_IMAGES,
     TEST_DB_URL,
     get_all_test_images,
 )
@@ -30,8 +29,35 @@ def test_images_dir():
     return IMAGES_DIR
 
 
+@pytest.fixture(scope="session")
+def _schema_template():
+    """Build the versioned schema once per session as a copy template.
+
+    create_all with the Continuum version tables is the expensive part of
+    engine setup; doing it once and cloning via SQLite's backup API keeps
+    per-test setup to a fast page copy.
+    """
+    # Import models and configure versioning BEFORE creating tables
+    from entity.models import Base
+    from sqlalchemy.orm import configure_mappers
+
+    # This must be called before create_all to ensure version tables are created
+    configure_mappers()
+
+    engine = create_engine(
+        TEST_DB_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+
+    yield engine
+
+    engine.dispose()
+
+
 @pytest.fixture(scope="function")
-def test_engine():
+def test_engine(_schema_template):
     """Create a test database engine with versioning support."""
     # Use in-memory SQLite with StaticPool for thread safety
     engine = create_engine(
@@ -39,21 +65,19 @@ def test_engine():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    
-    # Import models and configure versioning BEFORE creating tables
-    from entity.models import Base
-    from sqlalchemy.orm import configure_mappers
-    
-    # This must be called before create_all to ensure version tables are created
-    configure_mappers()
-    
-    # Now create all tables including version tables
-    Base.metadata.create_all(bind=engine)
-    
+
+    # Clone the pre-built schema into this engine's fresh in-memory DB
+    src = _schema_template.raw_connection()
+    dst = engine.raw_connection()
+    try:
+        src.driver_connection.backup(dst.driver_connection)
+    finally:
+        src.close()
+        dst.close()
+
     yield engine
-    
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
+
+    # Cleanup: disposing the StaticPool discards the in-memory database
     engine.dispose()
 
 
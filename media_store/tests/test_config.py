@@ -7,8 +7,9 @@ This module provides centralized configuration for all tests, including:
 - Configuration constants
 """
 
+import functools
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # Get the absolute path to the tests directory
 TESTS_DIR = Path(__file__).parent.absolute()
@@ -55,12 +56,14 @@ def load_test_files() -> List[Path]:
     return test_files
 
 
+@functools.cache
 def get_all_test_images() -> List[Path]:
     """
     Get all available test images.
-    
-    Loads test file paths from test_files.txt.
-    
+
+    Loads test file paths from test_files.txt. The result is cached so
+    repeated calls (one per fixture use) only walk the filesystem once.
+
     Returns:
         List of absolute Path objects for test images
     """
@@ -68,13 +71,26 @@ def get_all_test_images() -> List[Path]:
     return load_test_files()
 
 
-# Pre-load test images for convenience
-TEST_IMAGES = get_all_test_images()
+def _test_image(index: int) -> Optional[Path]:
+    """Return the nth test image, or None if not available."""
+    images = get_all_test_images()
+    return images[index] if len(images) > index else None
 
-# Specific test images (if available)
-PRIMARY_TEST_IMAGE = TEST_IMAGES[0] if len(TEST_IMAGES) > 0 else None
-SECONDARY_TEST_IMAGE = TEST_IMAGES[1] if len(TEST_IMAGES) > 1 else None
-TERTIARY_TEST_IMAGE = TEST_IMAGES[2] if len(TEST_IMAGES) > 2 else None
+
+def __getattr__(name: str):
+    """
+    Resolve the image constants lazily so importing this module (which
+    every test module does) never touches the filesystem by itself.
+    """
+    if name == "TEST_IMAGES":
+        return get_all_test_images()
+    if name == "PRIMARY_TEST_IMAGE":
+        return _test_image(0)
+    if name == "SECONDARY_TEST_IMAGE":
+        return _test_image(1)
+    if name == "TERTIARY_TEST_IMAGE":
+        return _test_image(2)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Test configuration constants
 TEST_DB_URL = "sqlite:///:memory:"